@@ -1,47 +1,160 @@
-import os
-import shutil
-
-def find_and_copy_files():
-    # Get the current directory
-    current_directory = os.getcwd()
-
-    # Find the first file with extension .fxo
-    fxo_files = [file for file in os.listdir(current_directory) if file.endswith('.fxo')]
-    if not fxo_files:
-        print("No .fxo files found in the directory.")
-        return
-
-    original_file = fxo_files[0]
-    print(f"Found this: {original_file}. Confirm copy? (Enter = confirm, X = cancel)")
-
-    confirmation = input().strip()
-
-    if confirmation.lower() == 'x':
-        print("File copy canceled. Please Exit.")
-        return
-    elif confirmation != '':
-        print("Invalid input. Please Restart Script.")
-        return
-
-    # Create a list of new filenames
-    new_filenames = [
-        'objectssoviet.fxo',
-        'objectsallied.fxo',
-        'objectsjapan.fxo',
-        'objectsgeneric.fxo',
-        'buildingssoviet.fxo',
-        'buildingsallied.fxo',
-        'buildingsjapan.fxo',
-        'buildingsgeneric.fxo'
-    ]
-
-    # Copy and rename the original file 8 times
-    for new_filename in new_filenames:
-        new_file_path = os.path.join(current_directory, new_filename)
-        shutil.copy(original_file, new_file_path)
-
-    print("Files copied and renamed.")
-
-if __name__ == "__main__":
-    find_and_copy_files()
-    input("Press any key to close the script and console.")
+#!/usr/bin/env python3
+"""
+Publishes faction variants of compiled shaders, as listed in a manifest.
+
+    python copyrename.py [-m shader_variants.ini] [-s SOURCE_DIR] [-o OUTPUT_DIR ...]
+                         [--mode auto|reflink|hardlink|copy] [-n]
+
+The manifest is an INI file whose [variants] section maps each source
+shader to its variant names (see shader_variants.ini). Every variant is
+reflinked, else copied from its source (--mode forces one method), and
+targets whose content already matches are left alone, so the command can
+be re-run for every mod at no cost.
+
+--mode hardlink is opt-in only: a hardlinked variant is the same file as its
+source, in every output folder, so editing or recompiling one of them in
+place changes the source and all the other variants (of every mod) with it.
+Without it, variants that are still hardlinks of their source are replaced
+by independent files.
+"""
+import os
+import sys
+import shutil
+import hashlib
+import argparse
+import tempfile
+import configparser
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_MANIFEST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "shader_variants.ini")
+FICLONE = 0x40049409  # Linux ioctl: share extents (btrfs, xfs, ...)
+
+def read_manifest(manifest_path):
+    """Returns {source name: [target names]} from the [variants] section."""
+    parser = configparser.ConfigParser(inline_comment_prefixes=(";", "#"))
+    parser.optionxform = str  # keep file name case
+    if not parser.read(manifest_path, encoding="utf-8"):
+        raise FileNotFoundError(f"manifest not found: {manifest_path}")
+    if not parser.has_section("variants"):
+        raise ValueError(f"{manifest_path} has no [variants] section")
+    return {source: [t.strip() for t in targets.replace("\n", ",").split(",") if t.strip()]
+            for source, targets in parser.items("variants")}
+
+def hash_file(file_path, chunk_size=1 << 20):
+    """SHA-1 hex digest of the file content."""
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _reflink(src, dst):
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError("reflink is not supported on this platform")
+    with open(src, 'rb') as s, open(dst, 'wb') as d:
+        fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+
+def _place(src, tmp, mode):
+    """Creates tmp from src with the first method that works. Returns its name."""
+    # Never hardlink unless asked to: the variant would alias its source.
+    methods = [mode] if mode != "auto" else ["reflink", "copy"]
+    for method in methods:
+        try:
+            if method == "reflink":
+                _reflink(src, tmp)
+            elif method == "hardlink":
+                os.link(src, tmp)
+            else:
+                shutil.copy2(src, tmp)
+            return method
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            if method == methods[-1]:
+                raise
+
+def publish_variant(src, src_hash, dst, mode="auto", dry_run=False):
+    """
+    Makes dst a copy of src unless its content already matches.
+    Returns "up to date" or the method used (reflink / hardlink / copy).
+    """
+    if os.path.exists(dst):
+        if os.path.samefile(src, dst):
+            # The source itself, or a hardlink to it: keep it only if that is what was asked.
+            if mode == "hardlink" or os.path.abspath(src) == os.path.abspath(dst):
+                return "up to date"
+        elif os.path.getsize(dst) == os.path.getsize(src) and hash_file(dst) == src_hash:
+            return "up to date"
+    if dry_run:
+        return "would update"
+    folder = os.path.dirname(os.path.abspath(dst))
+    os.makedirs(folder, exist_ok=True)
+    # Build next to the target, then swap it in, so a failure never leaves a partial file.
+    fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    os.close(fd)
+    os.remove(tmp)
+    try:
+        method = _place(src, tmp, mode)
+        os.replace(tmp, dst)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return method
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Publish faction variants of compiled shaders.")
+    parser.add_argument("-m", "--manifest", default=DEFAULT_MANIFEST,
+                        help="variant manifest (default: shader_variants.ini next to this script)")
+    parser.add_argument("-s", "--source-dir", default=os.getcwd(),
+                        help="folder with the source shaders (default: current folder)")
+    parser.add_argument("-o", "--output-dir", action="append",
+                        help="folder to publish into; repeat for several mods (default: source folder)")
+    parser.add_argument("--mode", choices=("auto", "reflink", "hardlink", "copy"), default="auto",
+                        help="how to create variants (default: reflink, else copy; "
+                             "hardlink makes every variant an alias of its source)")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="only report what would change")
+    args = parser.parse_args(argv)
+
+    try:
+        variants = read_manifest(args.manifest)
+    except (OSError, ValueError, configparser.Error) as e:
+        print(f"Cannot read manifest: {e}")
+        return 1
+    output_dirs = args.output_dir or [args.source_dir]
+
+    jobs = []
+    missing = 0
+    for source, targets in variants.items():
+        src = os.path.join(args.source_dir, source)
+        if not os.path.isfile(src):
+            print(f"Source shader not found, skipped: {src}")
+            missing += 1
+            continue
+        src_hash = hash_file(src)
+        for output_dir in output_dirs:
+            for target in targets:
+                jobs.append((src, src_hash, os.path.join(output_dir, target)))
+
+    counts = {}
+    failed = 0
+    with ThreadPoolExecutor() as pool:
+        futures = [(dst, pool.submit(publish_variant, src, src_hash, dst, args.mode, args.dry_run))
+                   for src, src_hash, dst in jobs]
+        for dst, future in futures:
+            try:
+                result = future.result()
+            except OSError as e:
+                failed += 1
+                print(f"{'FAILED':<12} {dst}: {e}")
+                continue
+            counts[result] = counts.get(result, 0) + 1
+            print(f"{result:<12} {dst}")
+
+    summary = ", ".join(f"{n} {result}" for result, n in sorted(counts.items())) or "nothing to do"
+    print(f"{len(jobs)} variant(s): {summary}; {failed} failed, {missing} source(s) missing.")
+    return 1 if failed or missing else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""
+Loads MAXscript/W3X_SKL_toMAX_2.PY on plain CPython, with pymxs and PySide2
+stubbed. Shared by the tests and other-tools/skl pipeline bench.PY.
+"""
+import os
+import sys
+import types
+import contextlib
+import importlib.util
+import importlib.machinery
+
+SKL_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "MAXscript", "W3X_SKL_toMAX_2.PY")
+
+class StubRuntime(object):
+    """Stands in for pymxs.runtime: counts calls, creates nothing."""
+    def __init__(self):
+        self.calls = 0
+
+    def print(self, msg):
+        self.calls += 1
+
+    def execute(self, script):
+        self.calls += 1
+
+    def redrawViews(self):
+        self.calls += 1
+
+    def w3xBuildHierarchy(self, names, kinds, transforms, parents, colors):
+        self.calls += 1
+        return list(names)
+
+def load_skl_module(path=SKL_SCRIPT):
+    """Loads the skeleton script with stubbed pymxs / PySide2 modules."""
+    pymxs = types.ModuleType("pymxs")
+    pymxs.runtime = StubRuntime()
+    pymxs.undo = lambda *args: contextlib.nullcontext()
+    pymxs.redraw = lambda *args: contextlib.nullcontext()
+    pyside2 = types.ModuleType("PySide2")
+    pyside2.QtWidgets = types.SimpleNamespace(QDialog=object)
+    pyside2.QtCore = types.SimpleNamespace()
+    sys.modules.setdefault("pymxs", pymxs)
+    sys.modules.setdefault("PySide2", pyside2)
+
+    loader = importlib.machinery.SourceFileLoader("w3x_skl_to_max", path)
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
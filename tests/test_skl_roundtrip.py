@@ -0,0 +1,83 @@
+"""
+Round trips of the sample skeleton in misc/ through the .SKL.ini and
+.SKL.bin formats of MAXscript/W3X_SKL_toMAX_2.PY.
+
+    python -m unittest discover tests
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from skl_stub import load_skl_module
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+SAMPLE_W3X = os.path.join(REPO_DIR, "misc", "GUENGINEER_SKL.w3x")
+SAMPLE_INI = os.path.join(REPO_DIR, "misc", "GUENGINEER_SKL.w3x.SKL.ini")
+
+skl = load_skl_module()
+
+class SkeletonRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="skl_roundtrip_")
+        self.pivot_list = skl.load_w3d_hierarchy(SAMPLE_W3X)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir)
+
+    def test_sample_parses(self):
+        self.assertEqual(len(self.pivot_list), 22)
+        self.assertEqual(self.pivot_list[0]["name"], "ROOTTRANSFORM")
+
+    def test_ini_round_trip(self):
+        ini_filename = os.path.join(self.work_dir, "GUENGINEER_SKL.w3x.SKL.ini")
+        skl.write_ini_file(self.pivot_list, ini_filename)
+        self.assertEqual(skl.read_ini_file(ini_filename), self.pivot_list)
+
+    def test_binary_round_trip(self):
+        bin_filename = os.path.join(self.work_dir, "GUENGINEER_SKL.w3x.SKL.bin")
+        skl.write_skl_binary(self.pivot_list, bin_filename)
+        self.assertEqual(skl.read_skl_binary(bin_filename), self.pivot_list)
+
+    def test_rewrite_matches_sample_ini(self):
+        ini_filename = os.path.join(self.work_dir, "GUENGINEER_SKL.w3x.SKL.ini")
+        skl.write_ini_file(self.pivot_list, ini_filename)
+        with open(ini_filename, 'rb') as written, open(SAMPLE_INI, 'rb') as sample:
+            self.assertEqual(written.read(), sample.read())
+
+class BatchWarningTest(unittest.TestCase):
+    def test_skipped_pivots_are_returned(self):
+        work_dir = tempfile.mkdtemp(prefix="skl_batch_")
+        self.addCleanup(shutil.rmtree, work_dir)
+        w3x_path = os.path.join(work_dir, "NOROT_SKL.w3x")
+        with open(SAMPLE_W3X, 'r', encoding='utf-8') as src, \
+                open(w3x_path, 'w', encoding='utf-8') as dst:
+            text = src.read()
+            start = text.index("<Rotation")
+            dst.write(text[:start] + text[text.index("/>", start) + 2:])
+        file_path, total, _, error, warnings = skl.convert_skl_file(w3x_path)
+        self.assertIsNone(error)
+        self.assertEqual(total, 21)
+        self.assertEqual(warnings, ["Skipping Pivot ROOTTRANSFORM: missing Translation or Rotation."])
+
+class ParseErrorPositionTest(unittest.TestCase):
+    def test_position_is_relative_to_the_file(self):
+        work_dir = tempfile.mkdtemp(prefix="skl_parse_error_")
+        self.addCleanup(shutil.rmtree, work_dir)
+        w3x_path = os.path.join(work_dir, "BROKEN_SKL.w3x")
+        with open(w3x_path, 'w', encoding='utf-8') as f:
+            f.write('<?xml version="1.0"?>\n<AssetDeclaration>\n')
+            f.write('\t<V X="0"/>\n' * 1000)
+            f.write('\t<W3DHierarchy id="BROKEN">\n'
+                    '\t\t<Pivot Name="ROOTTRANSFORM" Parent="-1">\n'
+                    '\t\t\t<Translation X="0" Y=0/>\n'
+                    '\t\t</Pivot>\n\t</W3DHierarchy>\n</AssetDeclaration>\n')
+        with self.assertRaises(skl.ET.ParseError) as expected:
+            skl.ET.parse(w3x_path)
+        with self.assertRaises(skl.ET.ParseError) as streamed:
+            list(skl.iter_w3d_pivots(w3x_path))
+        self.assertEqual(streamed.exception.position, expected.exception.position)
+        self.assertEqual(str(streamed.exception), str(expected.exception))
+
+if __name__ == '__main__':
+    unittest.main()